@@ -0,0 +1,96 @@
+"""
+Import-time regression guard for the CLI.
+
+Runs each fast-path command under `python -X importtime`, fails if any of
+them imports a heavy dependency, and fails if the median import time, not
+counting interpreter startup, exceeds the budget.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --max-ms 30 --repeat 7
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+MAIN_PY = os.path.join(os.path.dirname(__file__), "..", "main.py")
+
+# Commands that must stay fast — exit codes are ignored, only imports matter
+FAST_COMMANDS = [
+    ["--help"],
+    ["run", "--help"],
+    ["query", "SELECT COUNT(*) FROM nyc311_clean"],
+    ["report"],
+]
+
+# Top-level packages that must only be imported on the run/profile paths
+HEAVY_MODULES = {"pandas", "numpy", "pyarrow", "requests"}
+
+# Imported by the interpreter before main.py runs — not counted against the budget
+INTERPRETER_STARTUP = {"site", "encodings"}
+
+
+def measure(command: list[str]) -> tuple[float, set[str]]:
+    """
+    Run one CLI command under -X importtime.
+
+    Returns:
+        tuple: (import time in ms excluding interpreter startup, heavy top-level packages imported)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", MAIN_PY, *command],
+        capture_output=True,
+        text=True
+    )
+
+    total_us = 0
+    heavy = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        # Nested imports are indented — only top-level entries add to the total
+        if not name[1:].startswith(" ") and name.strip() not in INTERPRETER_STARTUP:
+            total_us += int(cumulative)
+        root = name.strip().split(".")[0]
+        if root in HEAVY_MODULES:
+            heavy.add(root)
+
+    return total_us / 1000, heavy
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="CLI import-time regression guard")
+    parser.add_argument("--max-ms", type=float, default=50.0, help="Import budget per command in ms (default: 50)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command; the median is compared (default: 5)")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'command':<45} {'median ms':>10}  heavy imports")
+    for command in FAST_COMMANDS:
+        runs = [measure(command) for _ in range(args.repeat)]
+        median_ms = statistics.median(ms for ms, _ in runs)
+        heavy = set().union(*(h for _, h in runs))
+
+        label = " ".join(command)
+        print(f"{label:<45} {median_ms:>10.1f}  {', '.join(sorted(heavy)) or '-'}")
+
+        if heavy:
+            failures.append(f"'{label}' imports {', '.join(sorted(heavy))}")
+        if median_ms > args.max_ms:
+            failures.append(f"'{label}' took {median_ms:.1f} ms (budget {args.max_ms:.0f} ms)")
+
+    if failures:
+        print("\nFAIL")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print("\nPASS")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
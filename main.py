@@ -6,10 +6,10 @@ from datetime import datetime
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "pipeline"))
 
-from extract import extract_nyc_311
-from transform import transform
-from dq_checks import run_dq_checks
-from load import load
+# Only stdlib is imported here — pandas, requests, and the pipeline stages
+# are imported inside the commands that need them, so --help, query, and
+# report start fast
+from paths import DB_PATH, REPORTS_DIR
 
 # Configure logging
 logging.basicConfig(
@@ -19,7 +19,12 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def run_pipeline(limit: int = 1000) -> None:
+def run_pipeline(
+    limit: int = 1000,
+    resume: str | None = None,
+    arrow: bool = False,
+    keep_checkpoints: bool = False
+) -> None:
     """
     Run the full NYC 311 data governance pipeline.
 
@@ -30,40 +35,98 @@ def run_pipeline(limit: int = 1000) -> None:
         4. Load — persist clean data to SQLite
         5. Export — save DQ report to reports/
 
+    Every stage output is checkpointed under reports/runs/<run_id>/ and
+    removed once the DQ report is exported; a completed load is recorded
+    in the same manifest. When resuming, stages with a valid checkpoint
+    are skipped, and so is the load if it already completed; once a stage
+    is recomputed, every later stage is recomputed too.
+
     Args:
         limit: Number of rows to pull from API (default 1000)
+        resume: Run id of a previous run to resume from (optional)
+        arrow: Keep data Arrow-backed from parse through load (default False)
+        keep_checkpoints: Keep checkpoints after a successful run (default False)
+
+    Raises:
+        ValueError: If resuming a run that was checkpointed with a different limit or arrow setting
     """
+    from extract import extract_nyc_311
+    from transform import transform
+    from dq_checks import run_dq_checks
+    from load import load
+    from checkpoint import (
+        new_run_id, input_fingerprint, run_fingerprint, run_exists,
+        save_checkpoint, load_checkpoint, mark_done, is_done, remove_run
+    )
+
     start_time = datetime.utcnow()
+    run_id = resume or new_run_id()
+    fingerprint = input_fingerprint(limit=limit, arrow=arrow)
+    reuse = resume is not None
+
+    # Refuse a mismatched resume rather than silently re-downloading everything
+    if reuse and run_fingerprint(run_id) not in (None, fingerprint):
+        message = (
+            f"Run {run_id} was checkpointed with a different --limit or --arrow setting — "
+            f"resume it with the original flags"
+        )
+        logger.error(message)
+        raise ValueError(message)
+
     logger.info("=" * 60)
     logger.info("NYC 311 DATA GOVERNANCE PIPELINE — STARTING")
     logger.info(f"Run timestamp: {start_time.isoformat()}")
+    logger.info(f"Run id: {run_id}" + (" (resumed)" if reuse else ""))
     logger.info(f"Row limit: {limit:,}")
+    logger.info(f"Arrow mode: {'on' if arrow else 'off'}")
     logger.info("=" * 60)
 
     try:
         # Step 1 — Extract
         logger.info("[STEP 1/4] Extract")
-        raw_df = extract_nyc_311(limit=limit)
+        raw_df = load_checkpoint(run_id, "raw", fingerprint) if reuse else None
+        if raw_df is None:
+            reuse = False
+            raw_df = extract_nyc_311(limit=limit, arrow=arrow)
+            save_checkpoint(run_id, "raw", raw_df, fingerprint)
         logger.info(f"Extract complete — {len(raw_df):,} rows")
 
         # Step 2 — Transform
         logger.info("[STEP 2/4] Transform")
-        transformed_df = transform(raw_df)
+        transformed_df = load_checkpoint(run_id, "transformed", fingerprint) if reuse else None
+        if transformed_df is None:
+            reuse = False
+            transformed_df = transform(raw_df, arrow=arrow)
+            save_checkpoint(run_id, "transformed", transformed_df, fingerprint)
         logger.info(f"Transform complete — {len(transformed_df):,} rows, {len(transformed_df.columns)} columns")
 
         # Step 3 — DQ Checks
         logger.info("[STEP 3/4] DQ Checks")
-        clean_df, dq_report = run_dq_checks(transformed_df)
+        clean_df = load_checkpoint(run_id, "clean", fingerprint) if reuse else None
+        dq_report = load_checkpoint(run_id, "dq_report", fingerprint) if reuse else None
+        if clean_df is None or dq_report is None:
+            reuse = False
+            clean_df, dq_report = run_dq_checks(transformed_df)
+            save_checkpoint(run_id, "clean", clean_df, fingerprint)
+            save_checkpoint(run_id, "dq_report", dq_report, fingerprint)
         logger.info(f"DQ checks complete — {len(clean_df):,} clean rows")
 
         # Step 4 — Load
         logger.info("[STEP 4/4] Load")
-        load(clean_df)
-        logger.info("Load complete")
+        if reuse and is_done(run_id, "load", fingerprint):
+            logger.info("Load already completed for this run — skipping")
+        else:
+            load(clean_df, arrow=arrow)
+            mark_done(run_id, "load", fingerprint, len(clean_df))
+            logger.info("Load complete")
 
         # Step 5 — Export DQ report
         _export_dq_report(dq_report)
 
+        # Checkpoints are only needed to recover a failed run
+        if not keep_checkpoints:
+            remove_run(run_id)
+
         # Summary
         end_time = datetime.utcnow()
         duration = (end_time - start_time).total_seconds()
@@ -81,17 +144,241 @@ def run_pipeline(limit: int = 1000) -> None:
 
     except Exception as e:
         logger.error(f"Pipeline failed: {e}")
+        if run_exists(run_id):
+            logger.error(f"Resume with: python main.py --limit {limit}{' --arrow' if arrow else ''} --resume {run_id}")
+        raise
+
+
+def run_partitioned_pipeline(
+    start: datetime,
+    end: datetime,
+    partitions: int,
+    workers: int,
+    page_size: int = 50000,
+    max_retries: int = 1,
+    arrow: bool = False,
+    resume: str | None = None
+) -> None:
+    """
+    Run the pipeline as a partition-parallel backfill.
+
+    The created_date range is split into partitions that are extracted,
+    transformed, and DQ-checked in a process pool. Clean rows are staged
+    by a single writer and swapped into nyc311_clean only once every
+    partition has succeeded; the per-partition DQ reports are merged into
+    one export. The staging data is removed only after the export, so a
+    failed export can be resumed without re-extracting anything.
+
+    Args:
+        start: Inclusive start of the backfill range
+        end: Exclusive end of the backfill range
+        partitions: Number of date-range partitions
+        workers: Number of worker processes
+        page_size: Rows per API request when paging through a partition (default 50,000)
+        max_retries: Extra attempts for failed partitions (default 1)
+        arrow: Keep data Arrow-backed from parse through load (default False)
+        resume: Run id of a failed backfill — only partitions not done are rerun (optional)
+    """
+    from partition import run_partitioned, backfill_exists, remove_backfill
+    from checkpoint import new_run_id
+
+    start_time = datetime.utcnow()
+    run_id = resume or new_run_id()
+    logger.info("=" * 60)
+    logger.info("NYC 311 DATA GOVERNANCE PIPELINE — PARTITIONED BACKFILL")
+    logger.info(f"Run timestamp: {start_time.isoformat()}")
+    logger.info(f"Run id: {run_id}" + (" (resumed)" if resume else ""))
+    logger.info(f"Range: {start.isoformat()} -> {end.isoformat()}")
+    logger.info(f"Partitions: {partitions} | Workers: {workers} | Page size: {page_size:,}")
+    logger.info("=" * 60)
+
+    try:
+        dq_report, rows_extracted, rows_loaded = run_partitioned(
+            run_id=run_id,
+            start=start,
+            end=end,
+            partitions=partitions,
+            workers=workers,
+            page_size=page_size,
+            max_retries=max_retries,
+            arrow=arrow
+        )
+
+        _export_dq_report(dq_report)
+        remove_backfill(run_id)
+
+        end_time = datetime.utcnow()
+        duration = (end_time - start_time).total_seconds()
+
+        logger.info("=" * 60)
+        logger.info("PIPELINE COMPLETE")
+        logger.info(f"Duration: {duration:.2f} seconds")
+        logger.info(f"Rows extracted: {rows_extracted:,}")
+        logger.info(f"Rows after DQ: {rows_loaded:,}")
+        logger.info(f"Rows dropped: {rows_extracted - rows_loaded:,}")
+        logger.info(f"DQ rules passed: {dq_report[dq_report['status'] == 'PASS'].shape[0]}")
+        logger.info(f"DQ rules failed: {dq_report[dq_report['status'] == 'FAIL'].shape[0]}")
+        logger.info(f"DQ rules warned: {dq_report[dq_report['status'] == 'WARN'].shape[0]}")
+        logger.info("=" * 60)
+
+    except Exception as e:
+        logger.error(f"Pipeline failed: {e}")
+        if backfill_exists(run_id):
+            logger.error(
+                f"Resume with: python main.py run --start {start.isoformat()} --end {end.isoformat()} "
+                f"--partitions {partitions} --page-size {page_size}{' --arrow' if arrow else ''} --resume {run_id}"
+            )
+        raise
+
+
+def profile_pipeline(limit: int = 1000, arrow: bool = False) -> None:
+    """
+    Time each pipeline stage and report its memory use, without writing anything.
+
+    Runs extract, transform, and DQ checks in-process. For each stage it
+    prints wall time, the stage's own peak Python allocations (tracemalloc
+    peak, reset between stages), and the process RSS high-water mark so
+    far. Nothing is loaded or exported, so the database and reports/ are
+    left untouched.
+
+    tracemalloc only sees memory allocated through Python, not Arrow
+    buffers, and tracing slows every stage down — compare timings between
+    profile runs, not against a normal run.
+
+    Args:
+        limit: Number of rows to pull from API (default 1000)
+        arrow: Profile the Arrow-backed data path (default False)
+    """
+    import time
+    import tracemalloc
+
+    timings = []
+
+    def profile_stage(stage, func, *args, **kwargs):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        stage_start = time.perf_counter()
+        result = func(*args, **kwargs)
+        seconds = time.perf_counter() - stage_start
+        alloc_peak = tracemalloc.get_traced_memory()[1] - baseline
+        timings.append((stage, seconds, alloc_peak / (1024 * 1024), _peak_rss_mb()))
+        return result
+
+    tracemalloc.start()
+    try:
+        extract_nyc_311, transform, run_dq_checks = profile_stage("import", _import_pipeline_stages)
+        raw_df = profile_stage("extract", extract_nyc_311, limit=limit, arrow=arrow)
+        transformed_df = profile_stage("transform", transform, raw_df, arrow=arrow)
+        profile_stage("dq_checks", run_dq_checks, transformed_df)
+    finally:
+        tracemalloc.stop()
+
+    rows = [
+        [stage, f"{seconds:.3f}", f"{alloc_peak:.1f}", "n/a" if rss is None else f"{rss:.1f}"]
+        for stage, seconds, alloc_peak, rss in timings
+    ]
+    print(f"Profile — {len(raw_df):,} rows, arrow mode {'on' if arrow else 'off'}")
+    _print_rows(["stage", "seconds", "stage_alloc_peak_mb", "rss_high_water_mb"], rows)
+
+
+def _import_pipeline_stages():
+    """Import the stages profile_pipeline runs, so the import cost can be measured."""
+    from extract import extract_nyc_311
+    from transform import transform
+    from dq_checks import run_dq_checks
+    return extract_nyc_311, transform, run_dq_checks
+
+
+def _peak_rss_mb() -> float | None:
+    """Highest resident set size of this process so far in MB, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_query(sql: str, as_csv: bool = False) -> None:
+    """
+    Run a read-only query against the SQLite database and print the results.
+
+    Uses sqlite3 directly rather than load.query so health checks and
+    ad-hoc lookups don't pay for importing pandas.
+
+    Args:
+        sql: SQL query string
+        as_csv: Print CSV instead of an aligned table (default False)
+    """
+    import sqlite3
+
+    if not os.path.exists(DB_PATH):
+        raise FileNotFoundError(f"Database not found at {DB_PATH} — run the pipeline first")
+
+    conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+    try:
+        cursor = conn.execute(sql)
+        header = [col[0] for col in cursor.description or []]
+        rows = cursor.fetchall()
+    except sqlite3.Error as e:
+        logger.error(f"Query failed: {e}")
         raise
+    finally:
+        conn.close()
+
+    _print_rows(header, rows, as_csv)
+
+
+def show_report(path: str | None = None, as_csv: bool = False) -> None:
+    """
+    Print a DQ report CSV — the most recent one in reports/ by default.
+
+    Args:
+        path: Path to a specific DQ report (optional)
+        as_csv: Print CSV instead of an aligned table (default False)
+    """
+    import csv
+    import glob
+
+    if path is None:
+        reports = sorted(glob.glob(os.path.join(REPORTS_DIR, "dq_report_*.csv")))
+        if not reports:
+            raise FileNotFoundError(f"No DQ reports found in {REPORTS_DIR} — run the pipeline first")
+        path = reports[-1]
+
+    with open(path, newline="") as f:
+        header, *rows = list(csv.reader(f))
+
+    if not as_csv:
+        print(f"DQ report: {os.path.abspath(path)}")
+    _print_rows(header, rows, as_csv)
+
+
+def _print_rows(header: list, rows: list, as_csv: bool = False) -> None:
+    """Print rows as CSV or as a left-aligned table."""
+    if as_csv:
+        import csv
+        writer = csv.writer(sys.stdout)
+        writer.writerow(header)
+        writer.writerows(rows)
+        return
+
+    cells = [[str(v) for v in header]] + [["" if v is None else str(v) for v in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(header))]
+    for i, row in enumerate(cells):
+        print("  ".join(v.ljust(w) for v, w in zip(row, widths)).rstrip())
+        if i == 0:
+            print("  ".join("-" * w for w in widths))
 
 
 def _export_dq_report(dq_report) -> None:
     """Export DQ report to reports/ folder with timestamp."""
-    reports_dir = os.path.join(os.path.dirname(__file__), "reports")
-    os.makedirs(reports_dir, exist_ok=True)
+    os.makedirs(REPORTS_DIR, exist_ok=True)
 
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     filename = f"dq_report_{timestamp}.csv"
-    filepath = os.path.join(reports_dir, filename)
+    filepath = os.path.join(REPORTS_DIR, filename)
 
     # Drop failed_row_ids column for clean CSV export
     export_df = dq_report.drop(columns=["failed_row_ids"])
@@ -100,14 +387,151 @@ def _export_dq_report(dq_report) -> None:
     logger.info(f"DQ report exported to: {filepath}")
 
 
-if __name__ == "__main__":
+COMMANDS = ["run", "query", "report", "profile"]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser with run, query, report, and profile subcommands."""
     parser = argparse.ArgumentParser(description="NYC 311 Data Governance Pipeline")
-    parser.add_argument(
+    subparsers = parser.add_subparsers(dest="command", metavar="{" + ",".join(COMMANDS) + "}")
+
+    run_parser = subparsers.add_parser("run", help="Run the pipeline (default when no command is given)")
+    # Each subcommand keeps its own parser so errors print that command's usage
+    run_parser.set_defaults(command_parser=run_parser)
+    run_parser.add_argument(
+        "--limit",
+        type=int,
+        help="Number of rows to pull from NYC Open Data API (default: 1000; not used with --partitions)"
+    )
+    run_parser.add_argument(
+        "--start",
+        type=datetime.fromisoformat,
+        help="Partitioned mode: inclusive created_date start, e.g. 2023-01-01"
+    )
+    run_parser.add_argument(
+        "--end",
+        type=datetime.fromisoformat,
+        help="Partitioned mode: exclusive created_date end, e.g. 2025-01-01"
+    )
+    run_parser.add_argument(
+        "--partitions",
+        type=int,
+        help="Split --start/--end into this many date-range partitions"
+    )
+    run_parser.add_argument(
+        "--page-size",
+        type=int,
+        help="Partitioned mode: rows per API request when paging through a partition (default: 50000)"
+    )
+    run_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Partitioned mode: worker processes (default: CPU count)"
+    )
+    run_parser.add_argument(
+        "--retries",
+        type=int,
+        help="Partitioned mode: extra attempts for partitions that fail (default: 1)"
+    )
+    run_parser.add_argument(
+        "--arrow",
+        action="store_true",
+        help="Opt-in Arrow-backed data path from parse through load (requires pyarrow)"
+    )
+    run_parser.add_argument(
+        "--keep-checkpoints",
+        action="store_true",
+        help="Keep stage checkpoints after a successful run (default: removed)"
+    )
+    run_parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Resume a previous run, skipping stages or partitions that already completed"
+    )
+
+    query_parser = subparsers.add_parser("query", help="Run a read-only SQL query against the database")
+    query_parser.set_defaults(command_parser=query_parser)
+    query_parser.add_argument("sql", help="SQL query string")
+    query_parser.add_argument("--csv", action="store_true", help="Print CSV instead of a table")
+
+    report_parser = subparsers.add_parser("report", help="Show the latest DQ report")
+    report_parser.set_defaults(command_parser=report_parser)
+    report_parser.add_argument("path", nargs="?", help="Path to a specific DQ report CSV (default: latest)")
+    report_parser.add_argument("--csv", action="store_true", help="Print CSV instead of a table")
+
+    profile_parser = subparsers.add_parser("profile", help="Time each stage and report its memory use, without loading")
+    profile_parser.set_defaults(command_parser=profile_parser)
+    profile_parser.add_argument(
         "--limit",
         type=int,
         default=1000,
         help="Number of rows to pull from NYC Open Data API (default: 1000)"
     )
-    args = parser.parse_args()
+    profile_parser.add_argument("--arrow", action="store_true", help="Profile the Arrow-backed data path")
+
+    return parser
 
-    run_pipeline(limit=args.limit)
\ No newline at end of file
+
+def main(argv: list[str] | None = None) -> None:
+    """CLI entry point."""
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Bare options (e.g. `main.py --limit 5000`) keep meaning `run`
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ("-h", "--help")):
+        argv = ["run", *argv]
+
+    args = build_parser().parse_args(argv)
+    command_parser = args.command_parser
+
+    if args.command in ("query", "report"):
+        try:
+            if args.command == "query":
+                run_query(args.sql, as_csv=args.csv)
+            else:
+                show_report(args.path, as_csv=args.csv)
+        except FileNotFoundError as e:
+            command_parser.exit(1, f"error: {e}\n")
+    elif args.command == "profile":
+        profile_pipeline(limit=args.limit, arrow=args.arrow)
+    elif args.partitions is not None:
+        if args.partitions < 1:
+            command_parser.error(f"--partitions must be at least 1, got {args.partitions}")
+        if args.start is None or args.end is None:
+            command_parser.error("--partitions requires --start and --end")
+        if args.limit is not None:
+            command_parser.error("--limit does not apply to --partitions — every row in each window is fetched; see --page-size")
+        if args.resume:
+            from partition import backfill_exists
+            if not backfill_exists(args.resume):
+                command_parser.error(f"no partitioned backfill found for run id '{args.resume}'")
+        run_partitioned_pipeline(
+            start=args.start,
+            end=args.end,
+            partitions=args.partitions,
+            workers=os.cpu_count() if args.workers is None else args.workers,
+            page_size=50000 if args.page_size is None else args.page_size,
+            max_retries=1 if args.retries is None else args.retries,
+            arrow=args.arrow,
+            resume=args.resume
+        )
+    else:
+        # Partition-only flags would otherwise be ignored by a single run
+        partition_flags = [
+            flag for flag, value in [
+                ("--start", args.start), ("--end", args.end), ("--page-size", args.page_size),
+                ("--workers", args.workers), ("--retries", args.retries)
+            ]
+            if value is not None
+        ]
+        if partition_flags:
+            command_parser.error(f"{', '.join(partition_flags)} only valid with --partitions")
+        if args.resume:
+            from checkpoint import run_exists
+            if not run_exists(args.resume):
+                command_parser.error(f"no checkpoints found for run id '{args.resume}'")
+        limit = 1000 if args.limit is None else args.limit
+        run_pipeline(limit=limit, resume=args.resume, arrow=args.arrow, keep_checkpoints=args.keep_checkpoints)
+
+
+if __name__ == "__main__":
+    main()
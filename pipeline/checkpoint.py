@@ -0,0 +1,180 @@
+import pandas as pd
+import hashlib
+import json
+import logging
+import os
+import secrets
+import shutil
+from datetime import datetime
+
+from paths import RUNS_DIR
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+# Stage outputs that get checkpointed, in pipeline order
+STAGES = ["raw", "transformed", "clean", "dq_report"]
+
+# Stages with side effects outside the run directory — only completion is recorded
+MARKER_STAGES = ["load"]
+
+
+def new_run_id() -> str:
+    """
+    Generate a run id from the current UTC timestamp plus a random suffix,
+    so runs started in the same second never share a run directory.
+    """
+    return f"{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{secrets.token_hex(3)}"
+
+
+def input_fingerprint(**params) -> str:
+    """
+    Fingerprint the inputs of a run so checkpoints from a run with
+    different parameters are never reused.
+
+    Args:
+        **params: Run parameters, e.g. limit=5000
+
+    Returns:
+        str: Short sha256 hex digest of the sorted parameters
+    """
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def run_exists(run_id: str) -> bool:
+    """Check whether a run directory with a manifest exists."""
+    return os.path.exists(os.path.join(RUNS_DIR, run_id, MANIFEST_NAME))
+
+
+def run_fingerprint(run_id: str) -> str | None:
+    """Input fingerprint a run was checkpointed with, or None if nothing was saved."""
+    entry = _read_manifest(run_id)["stages"].get(STAGES[0])
+    return None if entry is None else entry["fingerprint"]
+
+
+def remove_run(run_id: str) -> None:
+    """Delete a run directory and all of its checkpoints."""
+    run_dir = os.path.join(RUNS_DIR, run_id)
+    if os.path.exists(run_dir):
+        shutil.rmtree(run_dir)
+        logger.info(f"Checkpoints removed — run {run_id}")
+
+
+def save_checkpoint(run_id: str, stage: str, df: pd.DataFrame, fingerprint: str) -> None:
+    """
+    Persist a stage output and record it in the run manifest.
+
+    Files are written to a temp path and renamed into place, so a crash
+    mid-write never leaves a checkpoint that looks valid.
+
+    Args:
+        run_id: Run identifier
+        stage: One of STAGES
+        df: Stage output to persist
+        fingerprint: Input fingerprint of the run
+    """
+    run_dir = os.path.join(RUNS_DIR, run_id)
+    os.makedirs(run_dir, exist_ok=True)
+
+    filename = f"{stage}.pkl"
+    filepath = os.path.join(run_dir, filename)
+    df.to_pickle(filepath + ".tmp")
+    os.replace(filepath + ".tmp", filepath)
+
+    manifest = _read_manifest(run_id)
+    manifest["stages"][stage] = {
+        "file": filename,
+        "fingerprint": fingerprint,
+        "rows": len(df),
+        "bytes": os.path.getsize(filepath),
+        "saved_at": datetime.utcnow().isoformat()
+    }
+    _write_manifest(run_id, manifest)
+
+    logger.info(f"Checkpoint saved — run {run_id}, stage '{stage}', {len(df):,} rows")
+
+
+def load_checkpoint(run_id: str, stage: str, fingerprint: str) -> pd.DataFrame | None:
+    """
+    Load a stage output if a valid checkpoint exists.
+
+    A checkpoint is valid when its input fingerprint matches and the file
+    on disk is the one recorded in the manifest.
+
+    Args:
+        run_id: Run identifier
+        stage: One of STAGES
+        fingerprint: Input fingerprint of the current run
+
+    Returns:
+        pd.DataFrame | None: Stage output, or None if there is no valid checkpoint
+    """
+    manifest = _read_manifest(run_id)
+    entry = manifest["stages"].get(stage)
+
+    if entry is None:
+        return None
+    if entry["fingerprint"] != fingerprint:
+        logger.warning(f"Checkpoint '{stage}' for run {run_id} has a different input fingerprint — ignoring")
+        return None
+
+    filepath = os.path.join(RUNS_DIR, run_id, entry["file"])
+    if not os.path.exists(filepath) or os.path.getsize(filepath) != entry["bytes"]:
+        logger.warning(f"Checkpoint '{stage}' for run {run_id} is missing or incomplete — ignoring")
+        return None
+
+    df = pd.read_pickle(filepath)
+    logger.info(f"Checkpoint loaded — run {run_id}, stage '{stage}', {len(df):,} rows")
+    return df
+
+
+def mark_done(run_id: str, stage: str, fingerprint: str, rows: int) -> None:
+    """
+    Record that a side-effecting stage (e.g. load) has completed, so a
+    resumed run does not repeat it.
+
+    Args:
+        run_id: Run identifier
+        stage: One of MARKER_STAGES
+        fingerprint: Input fingerprint of the run
+        rows: Rows the stage wrote
+    """
+    manifest = _read_manifest(run_id)
+    manifest["stages"][stage] = {
+        "fingerprint": fingerprint,
+        "rows": rows,
+        "done_at": datetime.utcnow().isoformat()
+    }
+    _write_manifest(run_id, manifest)
+
+    logger.info(f"Stage marked done — run {run_id}, stage '{stage}'")
+
+
+def is_done(run_id: str, stage: str, fingerprint: str) -> bool:
+    """Check whether a side-effecting stage completed for a run with this input fingerprint."""
+    entry = _read_manifest(run_id)["stages"].get(stage)
+    return entry is not None and entry["fingerprint"] == fingerprint
+
+
+def _read_manifest(run_id: str) -> dict:
+    """Read a run manifest, or return an empty one."""
+    path = os.path.join(RUNS_DIR, run_id, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {"run_id": run_id, "stages": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_manifest(run_id: str, manifest: dict) -> None:
+    """Atomically write a run manifest."""
+    path = os.path.join(RUNS_DIR, run_id, MANIFEST_NAME)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + ".tmp", path)
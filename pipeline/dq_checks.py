@@ -47,7 +47,12 @@ def run_dq_checks(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
         (dq_report["status"] == "FAIL") & (dq_report["critical"] == True)
     ]["failed_row_ids"].explode().dropna().unique()
 
-    clean_df = df[~df["unique_key"].isin(critical_failures)].copy()
+    # Copy-on-write makes a defensive .copy() redundant — and when nothing
+    # failed, the input frame is passed through without selecting at all
+    if len(critical_failures) == 0:
+        clean_df = df
+    else:
+        clean_df = df[~df["unique_key"].isin(critical_failures)]
     logger.info(f"Clean dataframe shape after DQ: {clean_df.shape}")
 
     return clean_df, dq_report
@@ -13,12 +13,16 @@ logger = logging.getLogger(__name__)
 # NYC 311 API endpoint
 NYC_311_URL = "https://data.cityofnewyork.us/resource/erm2-nwe9.csv"
 
-def extract_nyc_311(limit: int = 50000) -> pd.DataFrame:
+# Floating timestamp format accepted by SoQL
+SOQL_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+def extract_nyc_311(limit: int = 50000, arrow: bool = False) -> pd.DataFrame:
     """
     Extract NYC 311 Service Request data from the NYC Open Data API.
     
     Args:
         limit: Number of records to fetch (default 50,000)
+        arrow: Parse with the pyarrow engine into Arrow-backed dtypes (default False)
     
     Returns:
         pd.DataFrame: Raw extracted data
@@ -34,27 +38,100 @@ def extract_nyc_311(limit: int = 50000) -> pd.DataFrame:
         "$order": "created_date DESC"
     }
 
+    df = _fetch_page(params, arrow)
+
+    # Validate we got data back
+    if df.empty:
+        logger.error("Data validation error: API returned an empty dataset.")
+        raise ValueError("API returned an empty dataset.")
+
+    logger.info(f"Extraction successful — {len(df):,} rows, {len(df.columns)} columns")
+    logger.info(f"Columns detected: {list(df.columns)}")
+
+    # Log extraction metadata
+    _log_extraction_metadata(df, limit)
+
+    return df
+
+
+def extract_nyc_311_window(
+    start: datetime,
+    end: datetime,
+    page_size: int = 50000,
+    arrow: bool = False
+) -> pd.DataFrame:
+    """
+    Extract every NYC 311 record created in a [start, end) window.
+
+    Pages through the window with $offset in a stable (created_date,
+    unique_key) order until a short page comes back, so no rows are lost
+    to the $limit cap. A window with no records returns an empty
+    dataframe rather than raising.
+
+    Args:
+        start: Fetch complaints created on or after this time
+        end: Fetch complaints created before this time
+        page_size: Rows per API request (default 50,000)
+        arrow: Parse with the pyarrow engine into Arrow-backed dtypes (default False)
+
+    Returns:
+        pd.DataFrame: Raw extracted data, possibly empty
+
+    Raises:
+        ConnectionError: If API is unreachable
+    """
+    where = _created_date_filter(start, end)
+    logger.info(f"Starting windowed extraction — {where} | page size: {page_size:,}")
+
+    pages = []
+    offset = 0
+    while True:
+        params = {
+            "$limit": page_size,
+            "$offset": offset,
+            "$order": "created_date, unique_key",
+            "$where": where
+        }
+        page = _fetch_page(params, arrow)
+        if not page.empty:
+            pages.append(page)
+        logger.info(f"Fetched page at offset {offset:,} — {len(page):,} rows")
+
+        if len(page) < page_size:
+            break
+        offset += page_size
+
+    if not pages:
+        logger.warning(f"No records in window {where}")
+        return pd.DataFrame()
+
+    df = pages[0] if len(pages) == 1 else pd.concat(pages, ignore_index=True)
+    logger.info(f"Windowed extraction successful — {len(df):,} rows in {len(pages)} pages")
+    _log_extraction_metadata(df, page_size)
+
+    return df
+
+
+def _fetch_page(params: dict, arrow: bool = False) -> pd.DataFrame:
+    """Request one page from the API and parse it into a dataframe."""
     try:
         # Ping the API
         logger.info(f"Pinging endpoint: {NYC_311_URL}")
         response = requests.get(NYC_311_URL, params=params, timeout=30)
         response.raise_for_status()
 
-        # Load into dataframe
-        from io import StringIO
-        df = pd.read_csv(StringIO(response.text))
-
-        # Validate we got data back
-        if df.empty:
-            raise ValueError("API returned an empty dataset.")
+        # A page past the end of the data may come back with no body at all
+        if not response.content.strip():
+            return pd.DataFrame()
 
-        logger.info(f"Extraction successful — {len(df):,} rows, {len(df.columns)} columns")
-        logger.info(f"Columns detected: {list(df.columns)}")
-
-        # Log extraction metadata
-        _log_extraction_metadata(df, limit)
+        # Load into dataframe
+        if arrow:
+            # Parse the raw bytes straight into Arrow buffers — no decoded str copy
+            from io import BytesIO
+            return pd.read_csv(BytesIO(response.content), engine="pyarrow", dtype_backend="pyarrow")
 
-        return df
+        from io import StringIO
+        return pd.read_csv(StringIO(response.text))
 
     except requests.exceptions.ConnectionError:
         logger.error("Connection failed — could not reach NYC Open Data API. Check your internet connection.")
@@ -65,14 +142,21 @@ def extract_nyc_311(limit: int = 50000) -> pd.DataFrame:
     except requests.exceptions.HTTPError as e:
         logger.error(f"HTTP error from API: {e}")
         raise
-    except ValueError as e:
-        logger.error(f"Data validation error: {e}")
-        raise
     except Exception as e:
         logger.error(f"Unexpected error during extraction: {e}")
         raise
 
 
+def _created_date_filter(start: datetime | None, end: datetime | None) -> str | None:
+    """Build a SoQL $where clause for a half-open [start, end) created_date window."""
+    clauses = []
+    if start is not None:
+        clauses.append(f"created_date >= '{start.strftime(SOQL_TIMESTAMP_FORMAT)}'")
+    if end is not None:
+        clauses.append(f"created_date < '{end.strftime(SOQL_TIMESTAMP_FORMAT)}'")
+    return " AND ".join(clauses) or None
+
+
 def _log_extraction_metadata(df: pd.DataFrame, limit: int) -> None:
     """Log extraction metadata for lineage tracking."""
     metadata = {
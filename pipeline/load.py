@@ -1,9 +1,13 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import sqlite3
 import logging
 import os
 from datetime import datetime
 
+from paths import DB_PATH
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -11,17 +15,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Database path — lives in reports/ folder
-DB_PATH = os.path.join(os.path.dirname(__file__), "..", "reports", "nyc311.db")
+# Source description written to lineage_log
+SOURCE_NAME = "NYC 311 Open Data API"
+
+# Rows per record batch when writing in Arrow mode
+ARROW_BATCH_ROWS = 10_000
 
 
-def load(df: pd.DataFrame, table_name: str = "nyc311_clean") -> None:
+def load(df: pd.DataFrame, table_name: str = "nyc311_clean", arrow: bool = False) -> None:
     """
     Load clean dataframe into SQLite database.
 
     Args:
         df: Clean dataframe from dq_checks.py
         table_name: Target table name (default: nyc311_clean)
+        arrow: Write Arrow record batches instead of going through to_sql (default False)
     """
     logger.info(f"Starting load — {len(df):,} rows into table '{table_name}'")
 
@@ -29,12 +37,15 @@ def load(df: pd.DataFrame, table_name: str = "nyc311_clean") -> None:
         conn = _get_connection()
 
         # Write dataframe to SQLite
-        df.to_sql(
-            name=table_name,
-            con=conn,
-            if_exists="replace",  # replace table on each run
-            index=False
-        )
+        if arrow:
+            _write_arrow_batches(conn, table_name, df)
+        else:
+            df.to_sql(
+                name=table_name,
+                con=conn,
+                if_exists="replace",  # replace table on each run
+                index=False
+            )
 
         # Verify load
         count = pd.read_sql(f"SELECT COUNT(*) as count FROM {table_name}", conn).iloc[0]["count"]
@@ -62,6 +73,150 @@ def _get_connection() -> sqlite3.Connection:
     return conn
 
 
+def _write_arrow_batches(conn: sqlite3.Connection, table_name: str, df: pd.DataFrame) -> None:
+    """
+    Write an Arrow-backed dataframe to SQLite one record batch at a time.
+
+    The table schema comes from pandas so it matches what to_sql creates.
+    The stdlib sqlite3 driver has no Arrow ingest, so each batch is still
+    converted to Python values for executemany — allocations are bounded
+    to one batch at a time, not removed.
+    """
+    conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+    conn.execute(pd.io.sql.get_schema(df.head(0), table_name, con=conn))
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    # Timestamps are stored as text, in the same format to_sql uses:
+    # microsecond precision, with the fraction only when it is non-zero
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type):
+            micros = pc.cast(table.column(i), pa.timestamp("us"), safe=False)
+            seconds = pc.cast(micros, pa.timestamp("s"), safe=False)
+            text = pc.if_else(
+                pc.equal(pc.subsecond(micros), 0),
+                pc.strftime(seconds, format="%Y-%m-%d %H:%M:%S"),
+                pc.strftime(micros, format="%Y-%m-%d %H:%M:%S")  # %S includes the fraction for us
+            )
+            table = table.set_column(i, field.name, text)
+
+    columns = ", ".join(f'"{name}"' for name in table.column_names)
+    placeholders = ", ".join("?" for _ in table.column_names)
+    insert_sql = f'INSERT INTO "{table_name}" ({columns}) VALUES ({placeholders})'
+
+    for batch in table.to_batches(max_chunksize=ARROW_BATCH_ROWS):
+        conn.executemany(insert_sql, zip(*(column.to_pylist() for column in batch.columns)))
+    conn.commit()
+
+    logger.info(f"Wrote {table.num_rows:,} rows as Arrow batches of up to {ARROW_BATCH_ROWS:,}")
+
+
+def load_staging(df: pd.DataFrame, staging_path: str, table_name: str, arrow: bool = False) -> None:
+    """
+    Write clean rows to a staging database, replacing any earlier attempt.
+
+    Used by partitioned backfills so nyc311_clean is untouched until
+    every partition has succeeded — see swap_in_staging.
+
+    Args:
+        df: Clean dataframe for one partition
+        staging_path: Path to the staging SQLite database
+        table_name: Staging table for this partition
+        arrow: Write Arrow record batches instead of going through to_sql (default False)
+    """
+    try:
+        conn = sqlite3.connect(staging_path)
+        if arrow:
+            _write_arrow_batches(conn, table_name, df)
+        else:
+            df.to_sql(name=table_name, con=conn, if_exists="replace", index=False)
+        conn.close()
+        logger.info(f"Staged {len(df):,} rows into '{table_name}' at {staging_path}")
+
+    except sqlite3.Error as e:
+        logger.error(f"SQLite error during staging load: {e}")
+        raise
+
+
+def swap_in_staging(
+    staging_path: str,
+    staging_tables: list[str],
+    lineage: list[dict],
+    table_name: str = "nyc311_clean"
+) -> int:
+    """
+    Replace a table with the union of staging tables in one transaction.
+
+    The new table is built next to the old one and renamed into place, and
+    the lineage rows are written in the same transaction, so a failure at
+    any point leaves the existing table and lineage_log untouched.
+
+    Args:
+        staging_path: Path to the staging SQLite database
+        staging_tables: Staging tables to combine, in load order
+        lineage: One dict per partition with source, rows_loaded, columns_loaded
+        table_name: Target table name (default: nyc311_clean)
+
+    Returns:
+        int: Rows in the new table
+    """
+    logger.info(f"Swapping {len(staging_tables)} staging tables into '{table_name}'")
+    new_table = f"{table_name}__new"
+
+    conn = _get_connection()
+    conn.isolation_level = None  # manage the transaction explicitly
+    try:
+        conn.execute("ATTACH DATABASE ? AS staging", (staging_path,))
+        conn.execute("BEGIN IMMEDIATE")
+
+        # Reuse the first staging table's schema, renamed to the new table
+        create_sql = conn.execute(
+            "SELECT sql FROM staging.sqlite_master WHERE type = 'table' AND name = ?",
+            (staging_tables[0],)
+        ).fetchone()[0]
+        columns = [row[1] for row in conn.execute(f'PRAGMA staging.table_info("{staging_tables[0]}")')]
+        column_list = ", ".join(f'"{c}"' for c in columns)
+
+        conn.execute(f'DROP TABLE IF EXISTS main."{new_table}"')
+        conn.execute(create_sql.replace(f'"{staging_tables[0]}"', f'main."{new_table}"', 1))
+        for staging_table in staging_tables:
+            conn.execute(
+                f'INSERT INTO main."{new_table}" ({column_list}) '
+                f'SELECT {column_list} FROM staging."{staging_table}"'
+            )
+
+        conn.execute(f'DROP TABLE IF EXISTS main."{table_name}"')
+        conn.execute(f'ALTER TABLE main."{new_table}" RENAME TO "{table_name}"')
+
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS main."lineage_log" ('
+            '"table_name" TEXT, "rows_loaded" INTEGER, "columns_loaded" INTEGER, '
+            '"loaded_at" TEXT, "source" TEXT)'
+        )
+        loaded_at = datetime.utcnow().isoformat()
+        conn.executemany(
+            'INSERT INTO main."lineage_log" (table_name, rows_loaded, columns_loaded, loaded_at, source) '
+            'VALUES (?, ?, ?, ?, ?)',
+            [
+                (table_name, entry["rows_loaded"], entry["columns_loaded"], loaded_at, entry["source"])
+                for entry in lineage
+            ]
+        )
+
+        count = conn.execute(f'SELECT COUNT(*) FROM main."{table_name}"').fetchone()[0]
+        conn.execute("COMMIT")
+        logger.info(f"Swap successful — {count:,} rows in '{table_name}', {len(lineage)} lineage rows written")
+        return count
+
+    except sqlite3.Error as e:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        logger.error(f"SQLite error during staging swap — '{table_name}' left unchanged: {e}")
+        raise
+    finally:
+        conn.close()
+
+
 def _log_load_metadata(conn: sqlite3.Connection, table_name: str, df: pd.DataFrame) -> None:
     """Log load metadata to a lineage tracking table."""
     metadata = pd.DataFrame([{
@@ -69,7 +224,7 @@ def _log_load_metadata(conn: sqlite3.Connection, table_name: str, df: pd.DataFra
         "rows_loaded": len(df),
         "columns_loaded": len(df.columns),
         "loaded_at": datetime.utcnow().isoformat(),
-        "source": "NYC 311 Open Data API"
+        "source": SOURCE_NAME
     }])
 
     metadata.to_sql(
@@ -0,0 +1,341 @@
+import pandas as pd
+import json
+import logging
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from extract import extract_nyc_311_window
+from transform import transform
+from dq_checks import run_dq_checks
+from load import load_staging, swap_in_staging, SOURCE_NAME
+from checkpoint import input_fingerprint
+from paths import RUNS_DIR
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# Backfill state — lives in reports/runs/<run_id>/ next to the staging data
+MANIFEST_NAME = "partitions.json"
+STAGING_DB_NAME = "staging.db"
+
+# Worst status wins when the same rule is merged across partitions
+STATUS_SEVERITY = {"PASS": 0, "WARN": 1, "FAIL": 2}
+
+# Columns of a DQ report, as produced by run_dq_checks
+REPORT_COLUMNS = [
+    "rule_id", "rule_name", "description", "column", "critical",
+    "violations", "violation_pct", "status", "failed_row_ids", "checked_at"
+]
+
+
+def plan_partitions(start: datetime, end: datetime, partitions: int) -> list[tuple[datetime, datetime]]:
+    """
+    Split a created_date range into contiguous, non-overlapping windows.
+
+    Args:
+        start: Inclusive start of the backfill range
+        end: Exclusive end of the backfill range
+        partitions: Number of windows to plan
+
+    Returns:
+        list: [start, end) tuples covering the full range in order
+
+    Raises:
+        ValueError: If the range is empty or partitions is not positive
+    """
+    if end <= start:
+        raise ValueError(f"Partition range is empty: {start.isoformat()} -> {end.isoformat()}")
+    if partitions < 1:
+        raise ValueError(f"partitions must be at least 1, got {partitions}")
+
+    bounds = pd.date_range(start=start, end=end, periods=partitions + 1)
+    windows = [
+        (bounds[i].to_pydatetime(), bounds[i + 1].to_pydatetime())
+        for i in range(partitions)
+    ]
+    logger.info(f"Planned {len(windows)} partitions from {start.isoformat()} to {end.isoformat()}")
+    return windows
+
+
+def partition_label(window: tuple[datetime, datetime]) -> str:
+    """Human-readable label for a [start, end) partition window."""
+    return f"[{window[0].isoformat()}, {window[1].isoformat()})"
+
+
+def backfill_exists(run_id: str) -> bool:
+    """Check whether a partitioned backfill with a manifest exists."""
+    return os.path.exists(os.path.join(RUNS_DIR, run_id, MANIFEST_NAME))
+
+
+def remove_backfill(run_id: str) -> None:
+    """Delete a backfill's staging database, DQ reports, and manifest."""
+    run_dir = os.path.join(RUNS_DIR, run_id)
+    if os.path.exists(run_dir):
+        shutil.rmtree(run_dir)
+        logger.info(f"Backfill {run_id} staging data removed")
+
+
+def run_partition(
+    window: tuple[datetime, datetime],
+    page_size: int,
+    arrow: bool = False
+) -> tuple[pd.DataFrame | None, pd.DataFrame | None, int]:
+    """
+    Run extract -> transform -> DQ for a single partition.
+
+    Runs inside a worker process; loading is left to the parent so that
+    only one process ever writes to SQLite. A window with no records is a
+    successful partition with zero rows — transform and DQ are skipped.
+
+    Args:
+        window: [start, end) created_date window
+        page_size: Rows per API request when paging through the window
+        arrow: Keep data Arrow-backed from parse through DQ (default False)
+
+    Returns:
+        tuple: (clean_df, dq_report_df, rows_extracted) — both frames are None for an empty window
+    """
+    label = partition_label(window)
+    logger.info(f"Partition {label} — starting")
+
+    raw_df = extract_nyc_311_window(window[0], window[1], page_size=page_size, arrow=arrow)
+    if raw_df.empty:
+        logger.info(f"Partition {label} — no records, skipping transform and DQ")
+        return None, None, 0
+
+    transformed_df = transform(raw_df, arrow=arrow)
+    clean_df, dq_report = run_dq_checks(transformed_df)
+    dq_report["partition"] = label
+
+    logger.info(f"Partition {label} — {len(raw_df):,} extracted, {len(clean_df):,} clean")
+    return clean_df, dq_report, len(raw_df)
+
+
+def merge_dq_reports(reports: list[pd.DataFrame], row_counts: list[int]) -> pd.DataFrame:
+    """
+    Merge per-partition DQ reports into one report with a row per rule.
+
+    Violations and failed_row_ids are summed across partitions,
+    violation_pct is recomputed against the total rows checked, and the
+    worst status seen for each rule wins.
+
+    Args:
+        reports: DQ reports from run_dq_checks, one per partition
+        row_counts: Rows checked in each partition, same order as reports
+
+    Returns:
+        pd.DataFrame: Merged DQ report with the same columns as run_dq_checks
+    """
+    if not reports:
+        return pd.DataFrame(columns=REPORT_COLUMNS)
+
+    total_rows = sum(row_counts)
+    combined = pd.concat(reports, ignore_index=True)
+
+    merged = []
+    for rule_id, rule_rows in combined.groupby("rule_id", sort=True):
+        first = rule_rows.iloc[0]
+        violations = int(rule_rows["violations"].sum())
+        status = max(rule_rows["status"], key=STATUS_SEVERITY.get)
+        merged.append({
+            "rule_id": rule_id,
+            "rule_name": first["rule_name"],
+            "description": first["description"],
+            "column": first["column"],
+            "critical": first["critical"],
+            "violations": violations,
+            "violation_pct": round(violations / total_rows * 100, 2) if total_rows else 0.0,
+            "status": status,
+            "failed_row_ids": [i for ids in rule_rows["failed_row_ids"] for i in ids],
+            "checked_at": rule_rows["checked_at"].max()
+        })
+
+    return pd.DataFrame(merged, columns=REPORT_COLUMNS)
+
+
+def run_partitioned(
+    run_id: str,
+    start: datetime,
+    end: datetime,
+    partitions: int,
+    workers: int,
+    page_size: int = 50000,
+    max_retries: int = 1,
+    arrow: bool = False
+) -> tuple[pd.DataFrame, int, int]:
+    """
+    Run the pipeline over date-range partitions in a process pool.
+
+    Workers extract, transform, and DQ-check their partition. The parent
+    process writes each result to a per-partition table in a staging
+    database under reports/runs/<run_id>/ and records the partition's
+    status in a manifest. Only once every partition has succeeded is
+    nyc311_clean replaced, in a single transaction, by the staged rows.
+
+    Failed partitions are retried on their own, up to max_retries extra
+    attempts. If any still fail, nyc311_clean is left untouched and a
+    later call with the same run_id reruns only the partitions that are
+    not done.
+
+    The run directory is kept after the swap, so the merged DQ report can
+    be rebuilt if exporting it fails — call remove_backfill once it has
+    been exported. Resuming a backfill that was already swapped in only
+    rebuilds the report; the swap and lineage rows are not repeated.
+
+    Args:
+        run_id: Backfill identifier — reuse one to resume a failed backfill
+        start: Inclusive start of the backfill range
+        end: Exclusive end of the backfill range
+        partitions: Number of date-range partitions
+        workers: Number of worker processes
+        page_size: Rows per API request when paging through a window (default 50,000)
+        max_retries: Extra attempts for failed partitions (default 1)
+        arrow: Keep data Arrow-backed from parse through load (default False)
+
+    Returns:
+        tuple: (merged_dq_report_df, rows_extracted, rows_loaded)
+
+    Raises:
+        ValueError: If run_id was planned with different inputs
+        RuntimeError: If any partition still fails after all retries
+    """
+    run_dir = os.path.join(RUNS_DIR, run_id)
+    staging_path = os.path.join(run_dir, STAGING_DB_NAME)
+    fingerprint = input_fingerprint(
+        start=start, end=end, partitions=partitions, page_size=page_size, arrow=arrow
+    )
+
+    manifest = _read_manifest(run_id)
+    if manifest is None:
+        os.makedirs(run_dir, exist_ok=True)
+        manifest = {
+            "run_id": run_id,
+            "fingerprint": fingerprint,
+            "partitions": [
+                {"index": i, "start": w[0].isoformat(), "end": w[1].isoformat(), "status": "pending"}
+                for i, w in enumerate(plan_partitions(start, end, partitions))
+            ]
+        }
+        _write_manifest(run_id, manifest)
+    elif manifest["fingerprint"] != fingerprint:
+        raise ValueError(f"Backfill {run_id} was planned with different inputs — resume it with the original flags")
+
+    entries = manifest["partitions"]
+    done = sum(e["status"] == "done" for e in entries)
+    if done:
+        logger.info(f"Resuming backfill {run_id} — skipping {done}/{len(entries)} partitions already done")
+
+    pending = [e for e in entries if e["status"] != "done"]
+    for attempt in range(max_retries + 1):
+        if not pending:
+            break
+        if attempt > 0:
+            logger.warning(f"Retrying {len(pending)} failed partitions (attempt {attempt + 1}/{max_retries + 1})")
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run_partition, _window(e), page_size, arrow): e for e in pending}
+
+            for future in as_completed(futures):
+                entry = futures[future]
+                label = partition_label(_window(entry))
+                try:
+                    clean_df, dq_report, extracted = future.result()
+                    _stage_partition(run_id, entry, clean_df, dq_report, extracted, arrow)
+                except Exception as e:
+                    logger.error(f"Partition {label} failed: {e}")
+                    entry.update(status="failed", error=str(e))
+                _write_manifest(run_id, manifest)
+
+        pending = [e for e in entries if e["status"] != "done"]
+
+    if pending:
+        labels = ", ".join(partition_label(_window(e)) for e in pending)
+        raise RuntimeError(
+            f"{len(pending)} partitions failed after {max_retries + 1} attempts: {labels} — "
+            f"nyc311_clean was not modified"
+        )
+
+    # Every partition succeeded — merge reports and swap the staged rows in
+    staged = [e for e in entries if e["table"] is not None]
+    reports = [pd.read_pickle(os.path.join(run_dir, e["dq_report"])) for e in staged]
+    dq_report = merge_dq_reports(reports, [e["rows_extracted"] for e in staged])
+    rows_extracted = sum(e["rows_extracted"] for e in entries)
+    rows_loaded = sum(e["rows_loaded"] for e in entries)
+
+    if manifest.get("swapped"):
+        logger.info(f"Backfill {run_id} was already swapped into nyc311_clean — rebuilding the DQ report only")
+    elif staged:
+        lineage = [
+            {
+                "source": f"{SOURCE_NAME} {partition_label(_window(e))}",
+                "rows_loaded": e["rows_loaded"],
+                "columns_loaded": e["columns_loaded"]
+            }
+            for e in entries
+        ]
+        swap_in_staging(staging_path, [e["table"] for e in staged], lineage)
+    else:
+        logger.warning("No records in any partition — nyc311_clean left unchanged")
+
+    manifest["swapped"] = True
+    _write_manifest(run_id, manifest)
+    logger.info(f"Backfill {run_id} complete")
+
+    return dq_report, rows_extracted, rows_loaded
+
+
+def _stage_partition(
+    run_id: str,
+    entry: dict,
+    clean_df: pd.DataFrame | None,
+    dq_report: pd.DataFrame | None,
+    extracted: int,
+    arrow: bool
+) -> None:
+    """Write one partition's results to staging and mark it done in the manifest entry."""
+    run_dir = os.path.join(RUNS_DIR, run_id)
+    table = report = None
+
+    if clean_df is not None:
+        table = f"partition_{entry['index']:04d}"
+        report = f"dq_{entry['index']:04d}.pkl"
+        load_staging(clean_df, os.path.join(run_dir, STAGING_DB_NAME), table, arrow=arrow)
+        dq_report.to_pickle(os.path.join(run_dir, report))
+
+    entry.update(
+        status="done",
+        error=None,
+        table=table,
+        dq_report=report,
+        rows_extracted=extracted,
+        rows_loaded=0 if clean_df is None else len(clean_df),
+        columns_loaded=0 if clean_df is None else len(clean_df.columns)
+    )
+
+
+def _window(entry: dict) -> tuple[datetime, datetime]:
+    """Partition window from a manifest entry."""
+    return datetime.fromisoformat(entry["start"]), datetime.fromisoformat(entry["end"])
+
+
+def _read_manifest(run_id: str) -> dict | None:
+    """Read a backfill manifest, or None if the backfill has not been planned."""
+    path = os.path.join(RUNS_DIR, run_id, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_manifest(run_id: str, manifest: dict) -> None:
+    """Atomically write a backfill manifest."""
+    path = os.path.join(RUNS_DIR, run_id, MANIFEST_NAME)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + ".tmp", path)
@@ -0,0 +1,11 @@
+import os
+
+# Project paths — stdlib only, so the CLI can resolve them without
+# importing pandas or any pipeline stage
+REPORTS_DIR = os.path.join(os.path.dirname(__file__), "..", "reports")
+
+# SQLite database — lives in reports/ folder
+DB_PATH = os.path.join(REPORTS_DIR, "nyc311.db")
+
+# Stage checkpoints — one subdirectory per run
+RUNS_DIR = os.path.join(REPORTS_DIR, "runs")
@@ -1,4 +1,6 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import logging
 from datetime import datetime
 
@@ -33,12 +35,13 @@ DATE_COLUMNS = [
 ]
 
 
-def transform(df: pd.DataFrame) -> pd.DataFrame:
+def transform(df: pd.DataFrame, arrow: bool = False) -> pd.DataFrame:
     """
     Apply all transformations to raw NYC 311 dataframe.
 
     Args:
         df: Raw dataframe from extract.py
+        arrow: Keep Arrow-backed string/timestamp dtypes from an Arrow extract (default False)
 
     Returns:
         pd.DataFrame: Cleaned, transformed dataframe
@@ -46,9 +49,9 @@ def transform(df: pd.DataFrame) -> pd.DataFrame:
     logger.info(f"Starting transformation — input shape: {df.shape}")
 
     df = _drop_columns(df)
-    df = _parse_dates(df)
-    df = _fix_dtypes(df)
-    df = _standardize_strings(df)
+    df = _parse_dates(df, arrow)
+    df = _fix_dtypes(df, arrow)
+    df = _standardize_strings(df, arrow)
     df = _add_derived_columns(df)
 
     logger.info(f"Transformation complete — output shape: {df.shape}")
@@ -63,36 +66,56 @@ def _drop_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _parse_dates(df: pd.DataFrame) -> pd.DataFrame:
+def _parse_dates(df: pd.DataFrame, arrow: bool = False) -> pd.DataFrame:
     """Convert date strings to datetime objects."""
     for col in DATE_COLUMNS:
         if col in df.columns:
-            df[col] = pd.to_datetime(df[col], errors="coerce")
+            if arrow:
+                # The pyarrow CSV reader usually infers timestamps already
+                if not _is_arrow_type(df[col], pa.types.is_timestamp):
+                    df[col] = pd.to_datetime(df[col], errors="coerce").astype(pd.ArrowDtype(pa.timestamp("ns")))
+            else:
+                df[col] = pd.to_datetime(df[col], errors="coerce")
             null_count = df[col].isnull().sum()
             logger.info(f"Parsed {col} to datetime — {null_count} nulls remaining")
     return df
 
 
-def _fix_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+def _fix_dtypes(df: pd.DataFrame, arrow: bool = False) -> pd.DataFrame:
     """Fix incorrect data types."""
     # incident_zip should be string not float
     if "incident_zip" in df.columns:
-        df["incident_zip"] = df["incident_zip"].apply(
-            lambda x: str(int(x)).zfill(5) if pd.notnull(x) else None
-        )
-        logger.info("Fixed incident_zip: float64 -> string (zero-padded)")
+        if arrow:
+            if _is_arrow_type(df["incident_zip"], lambda t: pa.types.is_integer(t) or pa.types.is_floating(t)):
+                # Vectorized in Arrow compute — truncate, cast, zero-pad
+                zips = pc.cast(pa.array(df["incident_zip"]), pa.int64(), safe=False)
+                zips = pc.utf8_lpad(pc.cast(zips, pa.string()), width=5, padding="0")
+                df["incident_zip"] = pd.Series(zips, index=df.index, dtype=pd.ArrowDtype(pa.string()))
+                logger.info("Fixed incident_zip: double[pyarrow] -> string[pyarrow] (zero-padded)")
+        else:
+            df["incident_zip"] = df["incident_zip"].apply(
+                lambda x: str(int(x)).zfill(5) if pd.notnull(x) else None
+            )
+            logger.info("Fixed incident_zip: float64 -> string (zero-padded)")
 
     # council_district should be int not float
     if "council_district" in df.columns:
-        df["council_district"] = df["council_district"].astype("Int64")
-        logger.info("Fixed council_district: float64 -> Int64")
+        if arrow:
+            df["council_district"] = df["council_district"].astype("int64[pyarrow]")
+            logger.info("Fixed council_district: double[pyarrow] -> int64[pyarrow]")
+        else:
+            df["council_district"] = df["council_district"].astype("Int64")
+            logger.info("Fixed council_district: float64 -> Int64")
 
     return df
 
 
-def _standardize_strings(df: pd.DataFrame) -> pd.DataFrame:
+def _standardize_strings(df: pd.DataFrame, arrow: bool = False) -> pd.DataFrame:
     """Standardize string columns — strip whitespace, title case key fields."""
-    string_cols = df.select_dtypes(include=["object", "str"]).columns
+    if arrow:
+        string_cols = [c for c in df.columns if _is_arrow_type(df[c], pa.types.is_string)]
+    else:
+        string_cols = df.select_dtypes(include=["object", "str"]).columns
 
     for col in string_cols:
         df[col] = df[col].str.strip()
@@ -129,6 +152,11 @@ def _add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _is_arrow_type(series: pd.Series, predicate) -> bool:
+    """Check whether a series is Arrow-backed with a type matching predicate."""
+    return isinstance(series.dtype, pd.ArrowDtype) and predicate(series.dtype.pyarrow_dtype)
+
+
 if __name__ == "__main__":
     from extract import extract_nyc_311
 
@@ -0,0 +1,46 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "pipeline"))
+
+
+def make_raw(start: str, rows: int, first_key: int = 0) -> pd.DataFrame:
+    """Raw NYC 311-shaped dataframe, as extract returns it, with created_date from start."""
+    rng = np.random.default_rng(first_key)
+    created = pd.Timestamp(start) + pd.to_timedelta(np.arange(rows) * 60, unit="s")
+    closed = pd.Series(created + pd.Timedelta(hours=2)).where(rng.random(rows) > 0.2)
+    return pd.DataFrame({
+        "unique_key": np.arange(first_key, first_key + rows),
+        "created_date": created.strftime("%Y-%m-%dT%H:%M:%S.000"),
+        "closed_date": closed.dt.strftime("%Y-%m-%dT%H:%M:%S.000"),
+        "complaint_type": rng.choice([" noise ", "HEAT/HOT WATER"], rows),
+        "descriptor": pd.Series(rng.choice(["Loud", None], rows, p=[0.9, 0.1]), dtype=object),
+        "incident_zip": rng.choice([10001.0, 11201.0, np.nan], rows),
+        "borough": rng.choice(["BROOKLYN", "QUEENS"], rows),
+        "city": rng.choice(["NEW YORK", "BROOKLYN"], rows),
+        "status": rng.choice(["Closed", "Open"], rows),
+        "resolution_description": pd.Series(rng.choice(["done", None], rows), dtype=object),
+        "latitude": rng.random(rows),
+        "longitude": rng.random(rows),
+        "council_district": rng.choice([1.0, 2.0, np.nan], rows),
+    })
+
+
+@pytest.fixture
+def tmp_reports(tmp_path, monkeypatch):
+    """Point the database and run directories at a temp folder."""
+    import checkpoint
+    import load
+    import partition
+
+    db_path = str(tmp_path / "nyc311.db")
+    runs_dir = str(tmp_path / "runs")
+    monkeypatch.setattr(load, "DB_PATH", db_path)
+    monkeypatch.setattr(checkpoint, "RUNS_DIR", runs_dir)
+    monkeypatch.setattr(partition, "RUNS_DIR", runs_dir)
+    return tmp_path
@@ -0,0 +1,96 @@
+import os
+import sqlite3
+
+import pytest
+
+import checkpoint
+import extract
+import load
+import main
+from conftest import make_raw
+
+
+@pytest.fixture
+def pipeline_env(tmp_reports, monkeypatch):
+    """Run main.run_pipeline against temp paths with a counting fake extract."""
+    calls = []
+
+    def fake_extract(limit=50000, arrow=False):
+        calls.append(limit)
+        return make_raw("2024-01-01", limit)
+
+    monkeypatch.setattr(extract, "extract_nyc_311", fake_extract)
+    monkeypatch.setattr(main, "REPORTS_DIR", str(tmp_reports / "reports"))
+    return calls
+
+
+def test_run_ids_are_unique_within_a_second():
+    assert len({checkpoint.new_run_id() for _ in range(50)}) == 50
+
+
+def test_successful_run_removes_checkpoints(pipeline_env, tmp_reports):
+    main.run_pipeline(limit=40)
+    assert not os.listdir(tmp_reports / "runs")
+
+
+def test_keep_checkpoints_leaves_run_directory(pipeline_env, tmp_reports):
+    main.run_pipeline(limit=40, keep_checkpoints=True)
+    (run_id,) = os.listdir(tmp_reports / "runs")
+    assert checkpoint.run_exists(run_id)
+
+
+def test_resume_after_load_failure_skips_extract(pipeline_env, tmp_reports, monkeypatch):
+    real_load = load.load
+    monkeypatch.setattr(load, "load", lambda *a, **k: (_ for _ in ()).throw(RuntimeError("disk full")))
+    with pytest.raises(RuntimeError):
+        main.run_pipeline(limit=40)
+    (run_id,) = os.listdir(tmp_reports / "runs")
+
+    monkeypatch.setattr(load, "load", real_load)
+    main.run_pipeline(limit=40, resume=run_id)
+
+    assert pipeline_env == [40]
+    assert not checkpoint.run_exists(run_id)
+
+
+def test_resume_with_different_flags_is_rejected(pipeline_env, tmp_reports, monkeypatch):
+    monkeypatch.setattr(load, "load", lambda *a, **k: (_ for _ in ()).throw(RuntimeError("disk full")))
+    with pytest.raises(RuntimeError):
+        main.run_pipeline(limit=40)
+    (run_id,) = os.listdir(tmp_reports / "runs")
+
+    with pytest.raises(ValueError):
+        main.run_pipeline(limit=40, resume=run_id, arrow=True)
+    assert pipeline_env == [40]
+
+
+def test_resume_after_export_failure_does_not_reload(pipeline_env, tmp_reports, monkeypatch):
+    real_export = main._export_dq_report
+    monkeypatch.setattr(main, "_export_dq_report", lambda df: (_ for _ in ()).throw(OSError("disk full")))
+    with pytest.raises(OSError):
+        main.run_pipeline(limit=40)
+    (run_id,) = os.listdir(tmp_reports / "runs")
+
+    monkeypatch.setattr(main, "_export_dq_report", real_export)
+    main.run_pipeline(limit=40, resume=run_id)
+
+    with sqlite3.connect(tmp_reports / "nyc311.db") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM lineage_log").fetchone()[0] == 1
+    assert os.listdir(tmp_reports / "reports")
+    assert not checkpoint.run_exists(run_id)
+
+
+def test_resume_hint_only_logged_when_checkpoints_exist(pipeline_env, tmp_reports, monkeypatch, caplog):
+    def failing_extract(limit=50000, arrow=False):
+        raise ConnectionError("API down")
+
+    monkeypatch.setattr(extract, "extract_nyc_311", failing_extract)
+    with pytest.raises(ConnectionError):
+        main.run_pipeline(limit=40)
+    assert "Resume with" not in caplog.text
+
+    monkeypatch.setattr(extract, "extract_nyc_311", lambda limit=50000, arrow=False: make_raw("2024-01-01", limit))
+    monkeypatch.setattr(load, "load", lambda *a, **k: (_ for _ in ()).throw(RuntimeError("disk full")))
+    with pytest.raises(RuntimeError):
+        main.run_pipeline(limit=40)
+    assert "Resume with" in caplog.text
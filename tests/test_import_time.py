@@ -0,0 +1,9 @@
+import pytest
+
+from benchmarks import import_time
+
+
+@pytest.mark.parametrize("command", import_time.FAST_COMMANDS, ids=" ".join)
+def test_fast_commands_do_not_import_heavy_dependencies(command):
+    _, heavy = import_time.measure(command)
+    assert not heavy, f"'{' '.join(command)}' imports {', '.join(sorted(heavy))} at startup"
@@ -0,0 +1,47 @@
+import sqlite3
+
+import pandas as pd
+
+import load
+
+
+def _stored_rows(db_path, table):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT * FROM {table} ORDER BY unique_key").fetchall()
+
+
+def test_arrow_load_stores_same_values_as_to_sql(tmp_reports):
+    df = pd.DataFrame({
+        "unique_key": [1, 2, 3],
+        "created_date": pd.to_datetime(
+            ["2024-01-01 10:00:00.750", "2024-01-01 10:00:00", "2024-01-01 10:00:00.000123456"],
+            format="ISO8601"
+        ).astype("datetime64[ns]"),
+        "borough": ["Brooklyn", None, "Queens"],
+        "council_district": pd.array([1, None, 3], dtype="Int64"),
+        "resolution_hours": [1.5, None, 0.25],
+        "is_open": [True, False, True],
+    })
+
+    load.load(df, table_name="via_to_sql")
+    load.load(df.convert_dtypes(dtype_backend="pyarrow"), table_name="via_arrow", arrow=True)
+
+    db_path = str(tmp_reports / "nyc311.db")
+    arrow_rows = _stored_rows(db_path, "via_arrow")
+    assert arrow_rows == _stored_rows(db_path, "via_to_sql")
+    assert [row[1] for row in arrow_rows] == [
+        "2024-01-01 10:00:00.750000",
+        "2024-01-01 10:00:00",
+        "2024-01-01 10:00:00.000123",
+    ]
+
+
+def test_arrow_load_stores_missing_timestamps_as_null(tmp_reports):
+    df = pd.DataFrame({
+        "unique_key": [1, 2],
+        "closed_date": pd.to_datetime(["2024-01-01 10:00:00", None]).astype("datetime64[ns]"),
+    }).convert_dtypes(dtype_backend="pyarrow")
+
+    load.load(df, table_name="via_arrow", arrow=True)
+
+    assert _stored_rows(str(tmp_reports / "nyc311.db"), "via_arrow") == [(1, "2024-01-01 10:00:00"), (2, None)]
@@ -0,0 +1,224 @@
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+import extract
+import main
+import partition
+from conftest import make_raw
+
+
+def _report(rule_id, violations, status, failed_ids, critical=True):
+    return {
+        "rule_id": rule_id,
+        "rule_name": rule_id,
+        "description": rule_id,
+        "column": "c",
+        "critical": critical,
+        "violations": violations,
+        "violation_pct": 0.0,
+        "status": status,
+        "failed_row_ids": failed_ids,
+        "checked_at": "2026-01-01T00:00:00",
+    }
+
+
+def test_plan_partitions_contiguous_and_non_overlapping():
+    start, end = datetime(2023, 1, 1), datetime(2025, 1, 1)
+    windows = partition.plan_partitions(start, end, 7)
+
+    assert len(windows) == 7
+    assert windows[0][0] == start
+    assert windows[-1][1] == end
+    for (_, prev_end), (next_start, _) in zip(windows, windows[1:]):
+        assert prev_end == next_start
+    assert all(lo < hi for lo, hi in windows)
+
+
+def test_plan_partitions_rejects_bad_input():
+    with pytest.raises(ValueError):
+        partition.plan_partitions(datetime(2024, 1, 2), datetime(2024, 1, 1), 2)
+    with pytest.raises(ValueError):
+        partition.plan_partitions(datetime(2024, 1, 1), datetime(2024, 1, 2), 0)
+
+
+def test_merge_dq_reports_recomputes_pct_and_keeps_worst_status():
+    first = pd.DataFrame([_report("DQ-001", 0, "PASS", []), _report("DQ-002", 3, "WARN", [1, 2, 3], critical=False)])
+    second = pd.DataFrame([_report("DQ-001", 2, "FAIL", [7, 8]), _report("DQ-002", 0, "PASS", [], critical=False)])
+
+    merged = partition.merge_dq_reports([first, second], [100, 300]).set_index("rule_id")
+
+    assert merged.loc["DQ-001", "violations"] == 2
+    assert merged.loc["DQ-001", "violation_pct"] == 0.5
+    assert merged.loc["DQ-001", "status"] == "FAIL"
+    assert merged.loc["DQ-001", "failed_row_ids"] == [7, 8]
+    assert merged.loc["DQ-002", "violation_pct"] == 0.75
+    assert merged.loc["DQ-002", "status"] == "WARN"
+
+
+def test_merge_dq_reports_with_no_reports_keeps_columns():
+    merged = partition.merge_dq_reports([], [])
+    assert merged.empty
+    assert list(merged.columns) == partition.REPORT_COLUMNS
+
+
+def test_extract_window_pages_until_short_page(monkeypatch):
+    raw = make_raw("2024-01-01", 25)
+    offsets = []
+
+    class Response:
+        def __init__(self, body):
+            self.content = body.encode()
+            self.text = body
+
+        def raise_for_status(self):
+            pass
+
+    def fake_get(url, params, timeout):
+        offsets.append(params["$offset"])
+        assert params["$order"] == "created_date, unique_key"
+        page = raw.iloc[params["$offset"]:params["$offset"] + params["$limit"]]
+        return Response(page.to_csv(index=False))
+
+    monkeypatch.setattr(extract.requests, "get", fake_get)
+    df = extract.extract_nyc_311_window(datetime(2024, 1, 1), datetime(2024, 1, 2), page_size=10)
+
+    assert offsets == [0, 10, 20]
+    assert df["unique_key"].tolist() == raw["unique_key"].tolist()
+
+
+def test_extract_window_returns_empty_frame_for_empty_window(monkeypatch):
+    class Response:
+        content = b"unique_key,created_date\n"
+        text = "unique_key,created_date\n"
+
+        def raise_for_status(self):
+            pass
+
+    monkeypatch.setattr(extract.requests, "get", lambda *a, **k: Response())
+    df = extract.extract_nyc_311_window(datetime(2024, 1, 1), datetime(2024, 1, 2), page_size=10)
+    assert df.empty
+
+
+@pytest.fixture
+def fake_windows(monkeypatch):
+    """Serve synthetic rows per window; windows listed in `failing` raise, `empty` return nothing."""
+    state = {"calls": [], "failing": set(), "empty": set()}
+
+    def fake_extract(start, end, page_size=50000, arrow=False):
+        state["calls"].append(start)
+        if start in state["failing"]:
+            raise ConnectionError(f"boom {start}")
+        if start in state["empty"]:
+            return pd.DataFrame()
+        return make_raw(start.isoformat(), 50, first_key=start.toordinal() * 1000)
+
+    # Threads share the monkeypatched module state regardless of start method
+    monkeypatch.setattr(partition, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(partition, "extract_nyc_311_window", fake_extract)
+    return state
+
+
+def _table_count(db_path, table):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_failed_backfill_leaves_table_untouched_and_resume_reruns_only_failures(tmp_reports, fake_windows):
+    db_path = str(tmp_reports / "nyc311.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE nyc311_clean (unique_key INTEGER)")
+        conn.execute("INSERT INTO nyc311_clean VALUES (1)")
+
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 5)
+    windows = partition.plan_partitions(start, end, 4)
+    fake_windows["failing"] = {windows[2][0]}
+    args = dict(start=start, end=end, partitions=4, workers=2, max_retries=1)
+
+    with pytest.raises(RuntimeError):
+        partition.run_partitioned("backfill", **args)
+
+    assert _table_count(db_path, "nyc311_clean") == 1
+    assert fake_windows["calls"].count(windows[2][0]) == 2
+    assert partition.backfill_exists("backfill")
+
+    fake_windows["failing"] = set()
+    fake_windows["calls"].clear()
+    dq_report, rows_extracted, rows_loaded = partition.run_partitioned("backfill", **args)
+
+    assert fake_windows["calls"] == [windows[2][0]]
+    assert rows_extracted == 200
+    assert _table_count(db_path, "nyc311_clean") == rows_loaded
+    assert _table_count(db_path, "lineage_log") == 4
+    assert set(dq_report["rule_id"]) == {f"DQ-00{i}" for i in range(1, 7)}
+
+    # Staging is kept until the caller has exported the report
+    assert partition.backfill_exists("backfill")
+    partition.remove_backfill("backfill")
+    assert not os.path.exists(tmp_reports / "runs" / "backfill")
+
+
+def test_resume_with_different_inputs_is_rejected(tmp_reports, fake_windows):
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 3)
+    fake_windows["failing"] = {start}
+    with pytest.raises(RuntimeError):
+        partition.run_partitioned("backfill", start, end, partitions=2, workers=1, max_retries=0)
+
+    with pytest.raises(ValueError):
+        partition.run_partitioned("backfill", start, end, partitions=3, workers=1, max_retries=0)
+
+
+def test_empty_window_is_a_successful_partition(tmp_reports, fake_windows):
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 4)
+    windows = partition.plan_partitions(start, end, 3)
+    fake_windows["empty"] = {windows[1][0]}
+
+    dq_report, rows_extracted, rows_loaded = partition.run_partitioned(
+        "backfill", start, end, partitions=3, workers=2, max_retries=0
+    )
+
+    assert rows_extracted == 100
+    assert fake_windows["calls"].count(windows[1][0]) == 1
+    assert _table_count(str(tmp_reports / "nyc311.db"), "nyc311_clean") == rows_loaded
+
+
+def test_resume_after_export_failure_rebuilds_report_without_reswapping(tmp_reports, fake_windows, monkeypatch):
+    reports_dir = tmp_reports / "reports"
+    monkeypatch.setattr(main, "REPORTS_DIR", str(reports_dir))
+    real_export = main._export_dq_report
+    monkeypatch.setattr(main, "_export_dq_report", lambda df: (_ for _ in ()).throw(OSError("disk full")))
+
+    args = dict(start=datetime(2024, 1, 1), end=datetime(2024, 1, 4), partitions=3, workers=2)
+    with pytest.raises(OSError):
+        main.run_partitioned_pipeline(resume="backfill", **args)
+    assert partition.backfill_exists("backfill")
+
+    monkeypatch.setattr(main, "_export_dq_report", real_export)
+    fake_windows["calls"].clear()
+    main.run_partitioned_pipeline(resume="backfill", **args)
+
+    db_path = str(tmp_reports / "nyc311.db")
+    assert fake_windows["calls"] == []
+    assert _table_count(db_path, "nyc311_clean") > 0
+    assert _table_count(db_path, "lineage_log") == 3
+    assert len(os.listdir(reports_dir)) == 1
+    assert not partition.backfill_exists("backfill")
+
+
+@pytest.mark.parametrize("argv, message", [
+    (["run", "--start", "2024-01-01", "--end", "2024-02-01"], "--start, --end only valid with --partitions"),
+    (["run", "--page-size", "100"], "--page-size only valid with --partitions"),
+    (["run", "--retries", "2"], "--retries only valid with --partitions"),
+    (["run", "--start", "2024-01-01", "--end", "2024-02-01", "--partitions", "0"], "--partitions must be at least 1"),
+])
+def test_cli_rejects_partition_flags_without_partitions(argv, message, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main.main(argv)
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert err.startswith("usage: ") and " run [-h]" in err.splitlines()[0]
+    assert message in err